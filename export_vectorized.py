@@ -1,41 +1,89 @@
 import argparse
+import atexit
+import copy
+import functools
 import tempfile
 import subprocess
 import logging
+import re
+import sys
 from pathlib import Path
+from typing import Optional
 from lxml import etree
 from urllib.parse import urlparse, unquote
+from concurrent.futures import ProcessPoolExecutor
 import os
 
 
 SVG_NS = "http://www.w3.org/2000/svg"
 XLINK_NS = "http://www.w3.org/1999/xlink"
-NSMAP = {"svg": SVG_NS, "xlink": XLINK_NS}
+IMAGE_TAG = f"{{{SVG_NS}}}image"
+HREF_ATTR = f"{{{XLINK_NS}}}href"
+
+# Environment variable naming the directory for the intermediate SVG handed
+# to Inkscape, e.g. /dev/shm to keep it in memory. Unset means the system
+# temporary directory.
+TMPDIR_ENV = "VECTORIZE_EXPORT_TMPDIR"
+
+_NUM_PATTERN = r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?"
+
+# A number as found in SVG viewBox lists.
+_NUM_RE = re.compile(_NUM_PATTERN)
+
+# An SVG length: a number with an optional absolute unit.
+_LENGTH_RE = re.compile(
+    rf"\s*({_NUM_PATTERN})\s*(px|mm|cm|in|pt|pc)?\s*", re.IGNORECASE
+)
+
+# User units (CSS pixels at 96 DPI) per absolute unit.
+_UNIT_SCALE = {
+    None: 1.0,
+    "px": 1.0,
+    "mm": 96 / 25.4,
+    "cm": 96 / 2.54,
+    "in": 96.0,
+    "pt": 96 / 72,
+    "pc": 16.0,
+}
 
 etree.register_namespace("svg", SVG_NS)
 etree.register_namespace("xlink", XLINK_NS)
 
 logger = logging.getLogger(__name__)
 
+# Per-process Inkscape shell, started lazily by _get_shell().
+_shell = None
 
-def make_absolute_href(href: str, base_path: Path) -> str:
+
+@functools.lru_cache(maxsize=None)
+def _resolve_linked_file(base_dir: str, href: str) -> Optional[str]:
+    """
+    Resolves a relative href against base_dir.
+    Returns the absolute path with forward slashes, or None if no such file exists.
+    """
+    abs_path = os.path.abspath(os.path.join(base_dir, href))
+    if not os.path.isfile(abs_path):
+        return None
+    return abs_path.replace(os.sep, "/")
+
+
+def make_absolute_href(href: str, base_path: Path) -> Optional[str]:
     """
     Converts a relative path in href into an absolute file URI path (with forward slashes).
     Leaves data URIs, http(s), and existing absolute paths alone.
+    Returns None if a relative path points to a missing file.
     """
     if (
-        href.startswith("data:")
-        or href.startswith("http:")
-        or href.startswith("https:")
-        or href.startswith("file:///")
-        or href.startswith("file:////")
-        or Path(href).is_absolute()
+        href.startswith(("data:", "http:", "https:", "file:///"))
+        or os.path.isabs(href)
     ):
         return href
 
-    abs_path = (base_path / href).resolve()
-    assert abs_path.is_file(), f"File {abs_path} doesn't exist!"
-    return "file:///" + abs_path.as_posix()
+    abs_path = _resolve_linked_file(os.fspath(base_path), href)
+    if abs_path is None:
+        logger.warning(f"Linked file not found: {base_path / href}")
+        return None
+    return "file:///" + abs_path
 
 
 def extract_path_from_href(href: str) -> Path:
@@ -47,8 +95,15 @@ def extract_path_from_href(href: str) -> Path:
         - already-absolute paths
     """
     if href.startswith("file://"):
-        parsed = urlparse(href)
-        path = unquote(parsed.path)
+        path = href[len("file://"):]
+        if not path.startswith("/"):
+            # file://host/path: let urlparse split off the host
+            path = urlparse(href).path
+        else:
+            # Drop any query or fragment, as urlparse would.
+            path = path.partition("?")[0].partition("#")[0]
+        if "%" in path:
+            path = unquote(path)
 
         # On Windows, remove leading slash if followed by a drive letter (e.g. /C:/...)
         if (
@@ -64,46 +119,181 @@ def extract_path_from_href(href: str) -> Path:
     return Path(href)
 
 
-def convert_to_plain_svg_if_needed(svg_path: Path) -> Path:
+class InkscapeShell:
+    """
+    A long-running ``inkscape --shell`` session.
+
+    Starting Inkscape dominates the runtime of a single export, so one shell
+    is kept open and fed action strings for every conversion and export.
+    Use it as a context manager so the process is always shut down.
+    """
+
+    PROMPT = "> "
+
+    def __init__(self, executable: str = "inkscape"):
+        # stderr goes to a temporary file rather than a pipe: Inkscape can be
+        # very chatty there and an undrained pipe would eventually block it.
+        # Unbuffered, so tell() and seek() see the offset Inkscape writes at.
+        self._stderr = tempfile.TemporaryFile(buffering=0)
+        self._stderr_start = 0
+        self._process = subprocess.Popen(
+            [executable, "--shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr,
+            encoding="utf-8",
+            errors="replace",
+        )
+        self._read_until_prompt()
+
+    def __enter__(self) -> "InkscapeShell":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _read_until_prompt(self) -> str:
+        """
+        Read Inkscape's stdout until it prints its input prompt, which means
+        the previous command has finished.
+        """
+        output = ""
+        while True:
+            char = self._process.stdout.read(1)
+            if not char:
+                # Reap the process so that is_running() reports it as gone.
+                self._process.wait()
+                raise RuntimeError(
+                    f"Inkscape shell exited unexpectedly:\n{self.stderr_output()}"
+                )
+            output += char
+            if output.endswith(self.PROMPT):
+                head = output[: -len(self.PROMPT)]
+                if not head or head.endswith("\n"):
+                    return head
+
+    def stderr_output(self) -> str:
+        """Return what Inkscape has written to stderr since the last command was sent."""
+        self._stderr.seek(self._stderr_start)
+        return self._stderr.read().decode(errors="replace")
+
+    def run(self, actions: str) -> str:
+        """
+        Send a line of ``;``-separated actions and wait for them to complete.
+
+        Returns:
+            str: Whatever Inkscape printed to stdout while running the actions.
+        """
+        logger.debug(f"Inkscape shell: {actions}")
+        self._stderr_start = self._stderr.tell()
+        self._process.stdin.write(actions + "\n")
+        self._process.stdin.flush()
+        return self._read_until_prompt()
+
+    @staticmethod
+    def accepts_paths(*paths: Path) -> bool:
+        """
+        Return whether the paths can be passed in a shell action line.
+        Inkscape splits the line on ";", and a newline would end it early.
+        """
+        return not any(c in str(path) for path in paths for c in ";\r\n")
+
+    def is_running(self) -> bool:
+        """Return whether the Inkscape process is still alive."""
+        return self._process.poll() is None
+
+    def close(self):
+        """Ask Inkscape to quit, killing it if it does not exit in time."""
+        if self.is_running():
+            try:
+                self._process.stdin.write("quit\n")
+                self._process.stdin.close()
+                self._process.wait(timeout=10)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+                self._process.wait()
+        try:
+            self._process.stdin.close()
+        except OSError:
+            # Flushing into the pipe of an already dead process fails.
+            pass
+        self._process.stdout.close()
+        self._stderr.close()
+
+
+def convert_to_plain_svg_if_needed(
+    svg_path: Path, shell: Optional[InkscapeShell] = None
+) -> Path:
     """
     If the SVG uses Inkscape-specific namespaces, convert it to Plain SVG
     using the modern Inkscape CLI. Otherwise, return the original path.
+
+    Args:
+        svg_path (Path): Path to the input SVG file.
+        shell (InkscapeShell, optional): Running Inkscape shell to use.
+            A one-off Inkscape process is started if omitted, or if a path
+            cannot be passed through the shell.
     """
+    # Only the namespace declarations on the root element matter, so stop
+    # reading as soon as the root element has started.
+    uses_inkscape_ns = False
     try:
-        tree = etree.parse(str(svg_path))
-        root = tree.getroot()
+        with open(svg_path, "rb") as f:
+            for event, value in etree.iterparse(f, events=("start-ns", "start")):
+                if event == "start":
+                    break
+                if value[0] in ("inkscape", "sodipodi"):
+                    uses_inkscape_ns = True
+                    break
     except etree.XMLSyntaxError as e:
         logger.error(f"Failed to parse SVG: {svg_path} - {e}")
         raise
 
-    nsmap = root.nsmap
-    if any(ns for ns in nsmap if ns in ["inkscape", "sodipodi"]):
+    if uses_inkscape_ns:
         logger.info(
             f"{svg_path.name} uses Inkscape-specific features. Converting to Plain SVG."
         )
         with tempfile.NamedTemporaryFile(delete=False, suffix=".svg", dir=svg_path.parent) as tmp_file:
             plain_svg_path = Path(tmp_file.name)
 
-        result = subprocess.run(
-            [
-                "inkscape",
-                str(svg_path),
-                "--export-plain-svg",
-                "--export-type=svg",
-                f"--export-filename={str(plain_svg_path)}",
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+        use_shell = shell is not None and shell.accepts_paths(
+            svg_path, plain_svg_path
         )
-
-        if result.returncode != 0:
-            logger.error(
-                f"Inkscape failed to convert to plain SVG:\n{result.stderr.decode()}"
+        if use_shell:
+            shell.run(
+                f"file-open:{svg_path}; export-plain-svg; export-type:svg; "
+                f"export-filename:{plain_svg_path}; export-do; file-close"
             )
-            raise RuntimeError("Inkscape export-plain-svg failed.")
+        else:
+            # Inkscape's output is only needed on failure, so keep it out of
+            # Python memory: discard stdout and spool stderr to a file.
+            with tempfile.TemporaryFile() as stderr_file:
+                result = subprocess.run(
+                    [
+                        "inkscape",
+                        str(svg_path),
+                        "--export-plain-svg",
+                        "--export-type=svg",
+                        f"--export-filename={str(plain_svg_path)}",
+                    ],
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr_file,
+                )
+
+                if result.returncode != 0:
+                    stderr_file.seek(0)
+                    logger.error(
+                        f"Inkscape failed to convert to plain SVG:\n{stderr_file.read().decode()}"
+                    )
+                    raise RuntimeError("Inkscape export-plain-svg failed.")
 
         if not plain_svg_path.exists() or plain_svg_path.stat().st_size == 0:
-            logger.error("Inkscape output file is empty or missing.")
+            if use_shell:
+                logger.error(
+                    f"Inkscape output file is empty or missing:\n{shell.stderr_output()}"
+                )
+            else:
+                logger.error("Inkscape output file is empty or missing.")
             raise RuntimeError("Plain SVG output is empty.")
 
         return plain_svg_path
@@ -112,15 +302,44 @@ def convert_to_plain_svg_if_needed(svg_path: Path) -> Path:
         return svg_path
 
 
-def inline_svg_image_element(image_elem, href: str, parser, href_attr: str):
+def _parse_length(value: str) -> float:
+    """
+    Parses an SVG length such as "12.5px" or "10mm" into user units.
+    Relative units (%, em, ex, ...) depend on context that is not available here,
+    so they raise ValueError like any other unparsable value.
+    """
+    match = _LENGTH_RE.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Unsupported SVG length: {value!r}")
+    number, unit = match.groups()
+    return float(number) * _UNIT_SCALE[unit.lower() if unit else None]
+
+
+def _make_parser() -> etree.XMLParser:
+    """
+    Creates the parser used for all SVG documents.
+    IDs are not looked up anywhere, so skip building the ID hash table.
+    """
+    return etree.XMLParser(remove_blank_text=True, collect_ids=False)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_linked_svg(abs_path: str):
+    """
+    Reads and parses a linked SVG file, returning its root element.
+    Cached so that a file linked several times is only read and parsed once.
+    The returned element is shared between callers and must not be modified.
+    """
+    return etree.parse(abs_path, _make_parser()).getroot()
+
+
+def inline_svg_image_element(image_elem, href: str):
     """
     Inlines a linked SVG file by replacing the <image> element with a transformed <g> element.
 
     Args:
         image_elem: The <image> element in the main SVG tree.
         href (str): The absolute path to the linked SVG file (as a string).
-        parser: XML parser instance.
-        href_attr (str): Fully-qualified xlink:href attribute name.
     """
     linked_path = extract_path_from_href(href)
     if not linked_path.exists():
@@ -128,35 +347,36 @@ def inline_svg_image_element(image_elem, href: str, parser, href_attr: str):
         return
 
     logger.info(f"Inlining linked SVG: {linked_path}")
-    sub_tree = etree.parse(str(linked_path), parser)
-    sub_root = sub_tree.getroot()
+    sub_root = _load_linked_svg(str(linked_path))
 
-    viewBox = sub_root.attrib.get("viewBox")
+    viewBox = sub_root.get("viewBox")
     if viewBox:
-        _, _, vb_width, vb_height = map(float, viewBox.strip().split())
+        _, _, vb_width, vb_height = map(float, _NUM_RE.findall(viewBox))
     else:
-        vb_width = float(sub_root.attrib.get("width", "1").replace("px", ""))
-        vb_height = float(sub_root.attrib.get("height", "1").replace("px", ""))
+        vb_width = _parse_length(sub_root.get("width", "1"))
+        vb_height = _parse_length(sub_root.get("height", "1"))
         logger.warning(
             f"No viewBox in {linked_path.name}; using width/height: {vb_width} x {vb_height}"
         )
 
-    x = float(image_elem.attrib.get("x", "0"))
-    y = float(image_elem.attrib.get("y", "0"))
-    width = float(image_elem.attrib.get("width", str(vb_width)))
-    height = float(image_elem.attrib.get("height", str(vb_height)))
+    x = _parse_length(image_elem.get("x", "0"))
+    y = _parse_length(image_elem.get("y", "0"))
+    width = image_elem.get("width")
+    width = _parse_length(width) if width else vb_width
+    height = image_elem.get("height")
+    height = _parse_length(height) if height else vb_height
 
     scale_x = width / vb_width
     scale_y = height / vb_height
 
-    transform_parts = [f"translate({x},{y})", f"scale({scale_x},{scale_y})"]
-    if "transform" in image_elem.attrib:
-        transform_parts.insert(0, image_elem.attrib["transform"])
-    total_transform = " ".join(transform_parts)
+    total_transform = f"translate({x},{y}) scale({scale_x},{scale_y})"
+    transform = image_elem.get("transform")
+    if transform:
+        total_transform = f"{transform} {total_transform}"
 
     wrapper = etree.Element(f"{{{SVG_NS}}}g", attrib={"transform": total_transform})
-    for elem in sub_root:
-        wrapper.append(elem)
+    # Copy the cached children so each inlined group owns its nodes.
+    wrapper.extend(copy.deepcopy(child) for child in sub_root)
 
     image_elem.getparent().replace(image_elem, wrapper)
 
@@ -171,68 +391,177 @@ def inline_linked_vectors(svg_path: Path) -> Path:
         svg_path (Path): Path to the input SVG file.
 
     Returns:
-        Path: Path to a temporary SVG file ready for export.
+        Path: Path to a temporary SVG file ready for export, or svg_path
+        itself if it contains no <image> elements.
     """
-    parser = etree.XMLParser(remove_blank_text=True)
-    tree = etree.parse(str(svg_path), parser)
-    root = tree.getroot()
+    with open(svg_path, "rb") as f:
+        data = f.read()
+
+    # Without any <image> element (possibly prefixed) there is nothing to rewrite.
+    if b"<image" not in data and b":image" not in data:
+        # Nothing to serialize, but still check that the document is
+        # well-formed so XML errors are reported here rather than by Inkscape.
+        etree.fromstring(data, _make_parser(), base_url=str(svg_path))
+        logger.info(f"No linked images in {svg_path.name}.")
+        return svg_path
 
-    href_attr = f"{{{XLINK_NS}}}href"
+    root = etree.fromstring(data, _make_parser(), base_url=str(svg_path))
+    tree = root.getroottree()
 
-    # First pass: make all relative paths absolute (png, jpg, pdf, svg)
-    for image in root.xpath(".//svg:image", namespaces=NSMAP):
-        href = image.attrib.get(href_attr)
+    # Single pass: make all relative paths absolute (png, jpg, pdf, svg) and
+    # collect the SVG links. Inlining replaces elements, so it runs afterwards.
+    base_dir = svg_path.parent.resolve()
+    linked_svgs = []
+    for _, image in etree.iterwalk(root, events=("start",), tag=IMAGE_TAG):
+        href = image.get(HREF_ATTR)
         if not href:
             continue
 
-        new_href = make_absolute_href(href, svg_path.parent)
-        if new_href != href:
-            if Path(extract_path_from_href(new_href)).exists():
-                image.attrib[href_attr] = new_href
-                logger.info(f"Made path absolute: {new_href}")
-            else:
-                logger.warning(f"Linked file not found: {new_href}")
-
-    # Second pass: inline SVGs only
-    for image in root.xpath(".//svg:image", namespaces=NSMAP):
-        href = image.attrib.get(href_attr)
-        if not href or not href.lower().endswith(".svg"):
+        new_href = make_absolute_href(href, base_dir)
+        if new_href is None:
+            # Leave the broken link as it is; never resolve it against the cwd.
             continue
-
-        inline_svg_image_element(image, href, parser, href_attr)
-
-    # Write to temporary SVG file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".svg") as tmp_file:
-        tree.write(
-            tmp_file.name, pretty_print=True, xml_declaration=True, encoding="UTF-8"
-        )
+        if new_href != href:
+            image.set(HREF_ATTR, new_href)
+            href = new_href
+            logger.info(f"Made path absolute: {new_href}")
+
+        if href.lower().endswith(".svg"):
+            linked_svgs.append((image, href))
+
+    # Inline SVGs only
+    for image, href in linked_svgs:
+        inline_svg_image_element(image, href)
+
+    # Write to temporary SVG file. Only Inkscape reads it, so skip pretty-printing.
+    with tempfile.NamedTemporaryFile(
+        delete=False, suffix=".svg", dir=os.environ.get(TMPDIR_ENV)
+    ) as tmp_file:
+        tree.write(tmp_file, xml_declaration=True, encoding="UTF-8")
         logger.info(f"Temporary SVG written: {tmp_file.name}")
         return Path(tmp_file.name)
 
 
-def export_to_pdf(svg_path: Path, pdf_path: Path):
+def export_to_pdf(
+    svg_path: Path, pdf_path: Path, shell: Optional[InkscapeShell] = None
+):
     """
     Exports the given SVG file to a PDF using Inkscape's command-line interface.
 
     Args:
         svg_path (Path): Path to the SVG file to export.
         pdf_path (Path): Path to the output PDF file.
+        shell (InkscapeShell, optional): Running Inkscape shell to use.
+            A one-off Inkscape process is started if omitted, or if a path
+            cannot be passed through the shell.
     """
     logger.info("Exporting to PDF with Inkscape...")
-    result = subprocess.run(
-        [
-            "inkscape",
-            str(svg_path),
-            "--export-type=pdf",
-            f"--export-filename={str(pdf_path)}",
-        ]
-    )
-    if result.returncode != 0:
-        logger.error("Inkscape export failed.")
-        raise RuntimeError("Inkscape export failed.")
+    if shell is not None and shell.accepts_paths(svg_path, pdf_path):
+        # The shell has no exit status, so export to a temporary file next to
+        # the target and only replace an existing PDF once the export worked.
+        with tempfile.NamedTemporaryFile(
+            delete=False, suffix=".pdf", dir=pdf_path.parent
+        ) as tmp_file:
+            tmp_pdf_path = Path(tmp_file.name)
+
+        try:
+            shell.run(
+                f"file-open:{svg_path}; export-type:pdf; "
+                f"export-filename:{tmp_pdf_path}; export-do; file-close"
+            )
+            if not tmp_pdf_path.exists() or tmp_pdf_path.stat().st_size == 0:
+                logger.error(f"Inkscape export failed:\n{shell.stderr_output()}")
+                raise RuntimeError("Inkscape export failed.")
+            os.replace(tmp_pdf_path, pdf_path)
+        finally:
+            tmp_pdf_path.unlink(missing_ok=True)
+    else:
+        result = subprocess.run(
+            [
+                "inkscape",
+                str(svg_path),
+                "--export-type=pdf",
+                f"--export-filename={str(pdf_path)}",
+            ]
+        )
+        if result.returncode != 0:
+            logger.error("Inkscape export failed.")
+            raise RuntimeError("Inkscape export failed.")
     logger.info(f"Exported successfully to: {pdf_path}")
 
 
+def _get_shell() -> InkscapeShell:
+    """
+    Return this process's Inkscape shell, starting it on first use.
+
+    Each worker process keeps its own shell for all the files it handles.
+    A shell whose Inkscape process has died is replaced by a new one.
+    """
+    global _shell
+    if _shell is not None and not _shell.is_running():
+        logger.warning("Inkscape shell has exited; starting a new one.")
+        atexit.unregister(_shell.close)
+        _shell.close()
+        _shell = None
+    if _shell is None:
+        _shell = InkscapeShell()
+        # Forked pool workers skip atexit, but Inkscape still quits once the
+        # worker dies and its stdin pipe is closed.
+        atexit.register(_shell.close)
+    return _shell
+
+
+def _init_worker(log_level: int):
+    """Configure logging in pool workers that do not inherit it."""
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+
+
+def process_one(input_svg: Path, output_pdf: Path):
+    """
+    Runs the full pipeline for one file: plain SVG conversion, inlining of
+    linked vectors and PDF export.
+
+    Args:
+        input_svg (Path): Path to the input SVG file.
+        output_pdf (Path): Path to the output PDF file.
+    """
+    shell = _get_shell()
+
+    logger.info("Checking for Inkscape-specific format...")
+    cleaned_svg_path = convert_to_plain_svg_if_needed(input_svg, shell)
+
+    try:
+        logger.info("Inlining linked vector files...")
+        inlined_svg_path = inline_linked_vectors(cleaned_svg_path)
+
+        try:
+            export_to_pdf(inlined_svg_path, output_pdf, shell)
+        finally:
+            if inlined_svg_path != cleaned_svg_path:
+                inlined_svg_path.unlink(missing_ok=True)
+                logger.info(f"Temporary file {inlined_svg_path} removed.")
+    finally:
+        if cleaned_svg_path != input_svg:
+            cleaned_svg_path.unlink(missing_ok=True)
+            logger.info(f"Temporary plain SVG {cleaned_svg_path} removed.")
+
+
+def _try_process_one(input_svg: Path, output_pdf: Path) -> bool:
+    """
+    Runs process_one, logging a failure instead of raising it so the rest
+    of the batch still gets exported.
+
+    Returns:
+        bool: True if the file was exported.
+    """
+    try:
+        process_one(input_svg, output_pdf)
+    except Exception:
+        logger.exception(f"Failed to export {input_svg} to {output_pdf}")
+        return False
+    return True
+
+
 def main():
     """
     Command-line interface for inlining linked vector images in an SVG
@@ -241,33 +570,51 @@ def main():
     parser = argparse.ArgumentParser(
         description="Inline linked SVGs and export to a fully vectorized PDF."
     )
-    parser.add_argument("input_svg", type=Path, help="Path to the input SVG file.")
-    parser.add_argument("output_pdf", type=Path, help="Path to the output PDF file.")
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        metavar="INPUT_SVG OUTPUT_PDF",
+        help="Pairs of input SVG and output PDF paths.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of files to process in parallel (default: one per CPU).",
+    )
     parser.add_argument(
         "--verbose", action="store_true", help="Enable verbose logging."
     )
     args = parser.parse_args()
 
-    logging.basicConfig(
-        level=logging.DEBUG if args.verbose else logging.INFO,
-        format="%(levelname)s: %(message)s",
-    )
-
-    logger.info("Checking for Inkscape-specific format...")
-    cleaned_svg_path = convert_to_plain_svg_if_needed(args.input_svg)
+    if len(args.paths) % 2 != 0:
+        parser.error("expected pairs of INPUT_SVG OUTPUT_PDF paths")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
-    logger.info("Inlining linked vector files...")
-    inlined_svg_path = inline_linked_vectors(cleaned_svg_path)
+    log_level = logging.DEBUG if args.verbose else logging.INFO
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
 
-    if cleaned_svg_path != args.input_svg:
-        cleaned_svg_path.unlink(missing_ok=True)
-        logger.info(f"Temporary plain SVG {cleaned_svg_path} removed.")
+    input_svgs = args.paths[::2]
+    output_pdfs = args.paths[1::2]
+    jobs = min(args.jobs, len(input_svgs))
 
-    try:
-        export_to_pdf(inlined_svg_path, args.output_pdf)
-    finally:
-        inlined_svg_path.unlink(missing_ok=True)
-        logger.info(f"Temporary file {inlined_svg_path} removed.")
+    if jobs == 1:
+        results = list(map(_try_process_one, input_svgs, output_pdfs))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(log_level,)
+        ) as executor:
+            results = list(executor.map(_try_process_one, input_svgs, output_pdfs))
+
+    failed = [str(path) for path, ok in zip(input_svgs, results) if not ok]
+    if failed:
+        logger.error(
+            f"{len(failed)} of {len(input_svgs)} files failed: {', '.join(failed)}"
+        )
+        sys.exit(1)
 
 
 if __name__ == "__main__":